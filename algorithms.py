@@ -1,20 +1,33 @@
-from objects import Process, ProcessCard, GanttCard, GanttChart
-import tkinter as tk
+from __future__ import annotations
+from process import Process
+from timeline import TraceWriter, DISPATCH, PREEMPT, COMPLETE
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from objects import GanttCard, GanttChart
+
+
+# The scheduling core stays free of tkinter; the GUI attaches chart, queue_frame and stats
 class ScedulingAlgorithm:
     chart:GanttChart = None
     queue_frame:tk.Frame = None
+    stats:tk.StringVar = None
+    comparison:tk.StringVar = None
     current_process:Process = None
     current_card:GanttCard = None
     processes:list[Process] = []
+    trace:TraceWriter = None
     queue:list
 
     def __init__(self, name):
         self.queue = []
         self.name = name
-        self.stats = tk.StringVar()
 
     def finished(self):
+        # Anything running or queued is unfinished, so only scan the table when idle
+        if self.current_process or self.queue:
+            return False
         return all(process.is_completed() for process in self.processes)
 
     def process(self, sim_time):
@@ -23,6 +36,28 @@ class ScedulingAlgorithm:
     def select(self) -> Process:
         pass
 
+    def new_card(self, process:Process) -> GanttCard | None:
+        # Headless runs have no chart to draw on
+        if self.chart is None:
+            return None
+        from objects import GanttCard
+        return GanttCard(self.chart.gantt_inner, process)
+
+    def record(self, event:int, sim_time:int, process:Process):
+        if self.trace:
+            self.trace.write(event, sim_time, process)
+
+    def dispatched(self, sim_time:int):
+        # Called whenever current_process has just been (re)assigned
+        if self.current_process:
+            if self.current_process.first_response < 0:
+                self.current_process.first_response = sim_time
+            self.record(DISPATCH, sim_time, self.current_process)
+
+    def completed(self, sim_time:int):
+        self.current_process.complete(sim_time)
+        self.record(COMPLETE, sim_time, self.current_process)
+
 
 class FirstComeFirstServe(ScedulingAlgorithm):
     def __init__(self):
@@ -34,22 +69,17 @@ class FirstComeFirstServe(ScedulingAlgorithm):
             if (self.current_card):
                 self.current_card.update_values()
             if (self.current_process.is_completed()):
-                self.current_process.complete(sim_time)
+                self.completed(sim_time)
                 self.current_process = self.select()
-                if (self.current_process):
-                    if (not self.current_process.first_response):
-                        self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
         else:
             self.current_process = self.select()
-            if (self.current_process):
-                if (not self.current_process.first_response):
-                    self.current_process.first_response = sim_time
+            self.dispatched(sim_time)
 
     def select(self):
-        assert self.chart != None
         try:
             current_process = self.queue.pop(0)
-            self.current_card = GanttCard(self.chart.gantt_inner, current_process)
+            self.current_card = self.new_card(current_process)
             return current_process
         except:
             return None
@@ -64,19 +94,14 @@ class ShortestJobFirst(ScedulingAlgorithm):
             if (self.current_card):
                 self.current_card.update_values()
             if (self.current_process.is_completed()):
-                self.current_process.complete(sim_time)
+                self.completed(sim_time)
                 self.current_process = self.select()
-                if (self.current_process):
-                    if (not self.current_process.first_response):
-                        self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
         else:
             self.current_process = self.select()
-            if (self.current_process):
-                if (not self.current_process.first_response):
-                    self.current_process.first_response = sim_time
+            self.dispatched(sim_time)
 
     def select(self):
-        assert self.chart != None
         try:
             # choose shortest remaining burst; tie-break by arrival, then numeric PID
             idx = None
@@ -90,7 +115,7 @@ class ShortestJobFirst(ScedulingAlgorithm):
 
             current_process = self.queue.pop(idx) if (idx is not None) else None
             if (current_process):
-                self.current_card = GanttCard(self.chart.gantt_inner, current_process)
+                self.current_card = self.new_card(current_process)
             return current_process
         except:
             return None
@@ -112,30 +137,27 @@ class RoundRobin(ScedulingAlgorithm):
                 self.current_card.update_values()
             # On completion, finalize and pick next
             if self.current_process.is_completed():
-                self.current_process.complete(sim_time)
+                self.completed(sim_time)
                 self.current_process = self.select()
                 self.time_in_quantum = 0
-                if self.current_process and not self.current_process.first_response:
-                    self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
             # Quantum expired: preempt and requeue
             elif self.time_in_quantum >= self.quantum_time:
+                self.record(PREEMPT, sim_time, self.current_process)
                 self.queue.append(self.current_process)
                 self.current_process = self.select()
                 self.time_in_quantum = 0
-                if self.current_process and not self.current_process.first_response:
-                    self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
         else:
             # No running process: try to select one
             self.current_process = self.select()
             self.time_in_quantum = 0
-            if self.current_process and not self.current_process.first_response:
-                self.current_process.first_response = sim_time
+            self.dispatched(sim_time)
 
     def select(self):
-        assert self.chart != None
         try:
             current_process = self.queue.pop(0)
-            self.current_card = GanttCard(self.chart.gantt_inner, current_process)
+            self.current_card = self.new_card(current_process)
             return current_process
         except:
             return None
@@ -152,17 +174,16 @@ class ShortestRemainingTimeFirst(ScedulingAlgorithm):
             candidate_idx = self._best_queue_idx()
             if candidate_idx is not None and self.queue[candidate_idx].burst_time < self.current_process.burst_time:
                 # preempt current
+                self.record(PREEMPT, sim_time, self.current_process)
                 self.queue.append(self.current_process)
                 self.current_process = self.queue.pop(candidate_idx)
-                self.current_card = GanttCard(self.chart.gantt_inner, self.current_process)
-                if not self.current_process.first_response:
-                    self.current_process.first_response = sim_time
+                self.current_card = self.new_card(self.current_process)
+                self.dispatched(sim_time)
 
         else:
             # no current, pick best
             self.current_process = self._pop_best_from_queue()
-            if self.current_process and not self.current_process.first_response:
-                self.current_process.first_response = sim_time
+            self.dispatched(sim_time)
 
         # Run one tick if we have a process
         if self.current_process:
@@ -170,10 +191,9 @@ class ShortestRemainingTimeFirst(ScedulingAlgorithm):
             if self.current_card:
                 self.current_card.update_values()
             if self.current_process.is_completed():
-                self.current_process.complete(sim_time)
+                self.completed(sim_time)
                 self.current_process = self._pop_best_from_queue()
-                if self.current_process and not self.current_process.first_response:
-                    self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
 
     def _best_queue_idx(self):
         if not self.queue:
@@ -192,7 +212,7 @@ class ShortestRemainingTimeFirst(ScedulingAlgorithm):
         if idx is None:
             return None
         current_process = self.queue.pop(idx)
-        self.current_card = GanttCard(self.chart.gantt_inner, current_process)
+        self.current_card = self.new_card(current_process)
         return current_process
 
 
@@ -207,17 +227,14 @@ class PriorityScheduling(ScedulingAlgorithm):
             if self.current_card:
                 self.current_card.update_values()
             if self.current_process.is_completed():
-                self.current_process.complete(sim_time)
+                self.completed(sim_time)
                 self.current_process = self.select()
-                if self.current_process and not self.current_process.first_response:
-                    self.current_process.first_response = sim_time
+                self.dispatched(sim_time)
         else:
             self.current_process = self.select()
-            if self.current_process and not self.current_process.first_response:
-                self.current_process.first_response = sim_time
+            self.dispatched(sim_time)
 
     def select(self) -> Process | None:
-        assert self.chart is not None
         if not self.queue:
             return None
         # lower priority value means higher priority (1 is highest)
@@ -230,5 +247,5 @@ class PriorityScheduling(ScedulingAlgorithm):
             )
         )
         current_process = self.queue.pop(idx)
-        self.current_card = GanttCard(self.chart.gantt_inner, current_process)
+        self.current_card = self.new_card(current_process)
         return current_process
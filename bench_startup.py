@@ -0,0 +1,50 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Modules that tools import headlessly; none of them may pull in the GUI stack
+CORE_MODULES = ["process", "algorithms", "engine", "snapshot", "timeline", "whatif", "replication", "scheduling_algo"]
+GUI_MODULES = ["tkinter", "pandas", "objects"]
+RUNS = 10
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUDGET_MS = 100
+
+
+def time_import(module:str, runs:int=RUNS) -> float:
+    """Median wall time in milliseconds of a fresh interpreter importing the module, minus a bare interpreter."""
+    check = f"import sys, {module}; loaded = [m for m in {GUI_MODULES!r} if m in sys.modules]; sys.exit(', '.join(loaded) or None)"
+    samples = []
+    baseline = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True, cwd=HERE)
+        baseline.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, cwd=HERE)
+        samples.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} loaded GUI modules: {result.stderr.strip()}")
+    return max(0.0, statistics.median(samples) - statistics.median(baseline)) * 1000
+
+
+def main():
+    failed = False
+    for module in CORE_MODULES:
+        try:
+            elapsed = time_import(module)
+        except RuntimeError as e:
+            print(e)
+            failed = True
+            continue
+        status = "ok" if elapsed <= BUDGET_MS else "SLOW"
+        failed = failed or elapsed > BUDGET_MS
+        print(f"{module:<16}{elapsed:8.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import copy
+import random
+import sys
+from process import Process
+from engine import default_algorithms, random_processes, reset, run, average_metrics
+from whatif import Baseline, Perturbation, burst_sensitivity
+
+
+# Resimulating from a snapshot must give exactly what a full run of the edited workload gives
+SEEDS = range(5)
+N_PROCESSES = 60
+
+
+def full_run(processes:list[Process], perturbation:Perturbation) -> dict[str, tuple[float, float, float]]:
+    workload = copy.deepcopy(processes)
+    perturbation.apply(workload)
+    algorithms = default_algorithms()
+    reset(algorithms, workload)
+    run(algorithms)
+    return {algorithm.name: average_metrics(algorithm.processes) for algorithm in algorithms}
+
+
+def perturbations_for(processes:list[Process], rng:random.Random) -> list[Perturbation]:
+    names = [process.name for process in processes]
+    latest = max(process.arrival_time for process in processes)
+    next_id = len(processes) + 1
+    perturbations = burst_sensitivity(processes)
+    perturbations.append(Perturbation(label="no edit"))
+    perturbations.append(Perturbation(deleted=[rng.choice(names)], label="delete"))
+    perturbations.append(Perturbation(added=[Process(f"P{next_id}", rng.randint(0, latest), rng.randint(1, 10), rng.randint(1, 4))], label="add"))
+    perturbations.append(Perturbation(added=[Process(f"P{next_id}", latest + 50, 3, 2)], label="add after baseline end"))
+    perturbations.append(Perturbation(
+        bursts={rng.choice(names): rng.randint(1, 10)},
+        added=[Process(f"P{next_id}", rng.randint(0, latest), rng.randint(1, 10), rng.randint(1, 4))],
+        deleted=[rng.choice(names)],
+        label="burst + add + delete",
+    ))
+    return perturbations
+
+
+def check_invalid(processes:list[Process]) -> list[str]:
+    baseline = Baseline(processes[:5])
+    existing = processes[0].name
+    cases = {
+        "zero burst": lambda: Perturbation(bursts={existing: 0}),
+        "negative arrival": lambda: Perturbation(added=[Process("P900", -1, 3, 2)]),
+        "bad priority": lambda: Perturbation(added=[Process("P900", 1, 3, 5)]),
+        "duplicate added": lambda: Perturbation(added=[Process("P900", 1, 3, 2), Process("P900", 2, 3, 2)]),
+        "name clash": lambda: baseline.evaluate(Perturbation(added=[Process(existing, 1, 3, 2)])),
+        "unknown name": lambda: baseline.evaluate(Perturbation(bursts={"P999": 3})),
+    }
+    failures = []
+    for label, case in cases.items():
+        try:
+            case()
+            failures.append(f"{label}: accepted")
+        except ValueError:
+            pass
+    return failures
+
+
+def main():
+    failures = []
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        processes = random_processes(N_PROCESSES, rng)
+        for process in processes:
+            process.arrival_time = rng.randint(0, 4 * N_PROCESSES)
+        baseline = Baseline(processes, max_checkpoints=8)
+        perturbations = perturbations_for(processes, rng)
+        expected = [full_run(processes, perturbation) for perturbation in perturbations]
+        serial = baseline.evaluate_many(perturbations, workers=1)
+        parallel = baseline.evaluate_many(perturbations, workers=2)
+        for perturbation, want, got, got_parallel in zip(perturbations, expected, serial, parallel):
+            if got != want:
+                failures.append(f"seed {seed}, {perturbation.label}: evaluate() differs from a full run")
+            if got_parallel != want:
+                failures.append(f"seed {seed}, {perturbation.label}: evaluate_many() differs from a full run")
+        print(f"seed {seed}: {len(perturbations)} perturbations checked")
+    failures += check_invalid(random_processes(10, random.Random(0)))
+    for failure in failures:
+        print(failure)
+    print("ok" if not failures else f"{len(failures)} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
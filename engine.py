@@ -0,0 +1,142 @@
+import bisect
+import copy
+import os
+import random
+from process import Process
+from snapshot import save_snapshot, load_snapshot
+from algorithms import ScedulingAlgorithm, FirstComeFirstServe, ShortestJobFirst, RoundRobin, ShortestRemainingTimeFirst, PriorityScheduling
+
+
+# Headless simulation core shared by the GUI and the batch tools; nothing here imports tkinter
+def default_algorithms() -> list[ScedulingAlgorithm]:
+    return [FirstComeFirstServe(), ShortestJobFirst(), RoundRobin(), ShortestRemainingTimeFirst(), PriorityScheduling()]
+
+
+def random_processes(n:int=10, rng:random.Random=random) -> list[Process]:
+    return [Process(f'P{str(i)}', rng.randint(0, 10), rng.randint(1, 10), rng.randint(1, 4)) for i in range(1, n+1)]
+
+
+def arrival_order(process:Process):
+    return (process.arrival_time, int(process.name[1:]))
+
+
+def _arrival_time(process:Process) -> int:
+    return process.arrival_time
+
+
+def reset(algorithms:list[ScedulingAlgorithm], processes:list[Process]):
+    """Give every algorithm its own fresh copy of the workload, sorted by arrival."""
+    for algorithm in algorithms:
+        algorithm.current_card = None
+        algorithm.current_process = None
+        algorithm.queue.clear()
+        algorithm.processes = copy.deepcopy(processes)
+        algorithm.processes.sort(key=arrival_order)
+        if hasattr(algorithm, "time_in_quantum"):
+            algorithm.time_in_quantum = 0
+
+
+def tick(algorithms:list[ScedulingAlgorithm], sim_time:int):
+    """Advance every algorithm by one time unit: admit arrivals, then run."""
+    # Checking arrival time to add to queue; process tables are kept in arrival order by reset()
+    for algorithm in algorithms:
+        start = bisect.bisect_left(algorithm.processes, sim_time, key=_arrival_time)
+        end = bisect.bisect_right(algorithm.processes, sim_time, lo=start, key=_arrival_time)
+        algorithm.queue.extend(algorithm.processes[start:end])
+
+    #Processing the current process
+    for algorithm in algorithms:
+        algorithm.process(sim_time)
+
+
+def finished(algorithms:list[ScedulingAlgorithm]) -> bool:
+    return all(algorithm.finished() for algorithm in algorithms)
+
+
+def validate_process(process:Process):
+    """Raise ValueError for the values ModifyWindow refuses to save."""
+    if process.arrival_time < 0 or process.original_burst_time <= 0 or process.original_priority not in [1, 2, 3, 4]:
+        raise ValueError(f"Invalid values for {process.name}.")
+
+
+def validate(algorithms:list[ScedulingAlgorithm], sim_time:int=0):
+    """Check that every process table can run to completion from sim_time."""
+    for algorithm in algorithms:
+        admitted = {id(process) for process in algorithm.queue}
+        if algorithm.current_process:
+            admitted.add(id(algorithm.current_process))
+        for process in algorithm.processes:
+            validate_process(process)
+            if process.burst_time < 0:
+                raise ValueError(f"{process.name} has a negative remaining burst time in {algorithm.name}.")
+            # Admission only happens at arrival_time, so a missed process would never run
+            if process.arrival_time < sim_time and not process.is_completed() and id(process) not in admitted:
+                raise ValueError(f"{process.name} arrived before time {sim_time} but was never admitted in {algorithm.name}.")
+
+
+def time_limit(algorithms:list[ScedulingAlgorithm], sim_time:int=0) -> int:
+    # Generous bound: besides idling until the last arrival, every unit of burst costs at most one
+    # run tick plus one dispatch/requeue tick, and each process can add one more on completion
+    limit = sim_time
+    for algorithm in algorithms:
+        latest = max((process.arrival_time for process in algorithm.processes), default=0)
+        remaining = sum(process.burst_time for process in algorithm.processes)
+        limit = max(limit, max(latest, sim_time) + 3 * remaining + len(algorithm.processes) + 1)
+    return limit
+
+
+def checkpoint(algorithms:list[ScedulingAlgorithm], sim_time:int, checkpoint_path:str):
+    # Traces must reach the disk before the snapshot that resuming will truncate them to
+    for algorithm in algorithms:
+        if algorithm.trace:
+            algorithm.trace.flush()
+    save_snapshot(checkpoint_path, sim_time, algorithms)
+
+
+def remove_checkpoint(checkpoint_path:str):
+    for path in (checkpoint_path, checkpoint_path + ".tmp"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run(algorithms:list[ScedulingAlgorithm], sim_time:int=0, checkpoint_path:str|None=None, checkpoint_interval:int=50) -> int:
+    """Run until every algorithm has finished and return the final sim_time.
+
+    With a checkpoint_path, a snapshot is saved every checkpoint_interval ticks and removed once the run finishes.
+    """
+    validate(algorithms, sim_time)
+    limit = time_limit(algorithms, sim_time)
+    while True:
+        tick(algorithms, sim_time)
+        if finished(algorithms):
+            if checkpoint_path:
+                remove_checkpoint(checkpoint_path)
+            return sim_time
+        if sim_time >= limit:
+            raise RuntimeError(f"Simulation did not finish by time {limit}.")
+        sim_time += 1
+        if checkpoint_path and sim_time % checkpoint_interval == 0:
+            checkpoint(algorithms, sim_time, checkpoint_path)
+
+
+def resume(algorithms:list[ScedulingAlgorithm], checkpoint_path:str, checkpoint_interval:int=50) -> int:
+    """Continue an interrupted run from its last checkpoint and return the final sim_time."""
+    sim_time = load_snapshot(checkpoint_path, algorithms)
+    return run(algorithms, sim_time, checkpoint_path, checkpoint_interval)
+
+
+def average_metrics(processes:list[Process]) -> tuple[float, float, float]:
+    """Average waiting, turnaround and response time."""
+    total_wait = 0
+    total_turnaround = 0
+    total_response = 0
+    for p in processes:
+        total_wait += p.turnaround_time - p.original_burst_time
+        total_turnaround += p.turnaround_time
+        if p.first_response >= 0:
+            total_response += p.first_response - p.arrival_time
+    n = len(processes)
+    avg_wait = total_wait / n if n else 0
+    avg_turnaround = total_turnaround / n if n else 0
+    avg_response = total_response / n if n else 0
+    return avg_wait, avg_turnaround, avg_response
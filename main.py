@@ -1,17 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from objects import ProcessCard, Process, ModifyWindow, GanttCard, GanttChart
-from algorithms import ScedulingAlgorithm, FirstComeFirstServe, ShortestJobFirst, RoundRobin, ShortestRemainingTimeFirst, PriorityScheduling
-import copy
+from algorithms import ScedulingAlgorithm
+from engine import default_algorithms, random_processes, reset, tick, finished, average_metrics, checkpoint, remove_checkpoint
+from snapshot import load_snapshot, SnapshotError
+from timeline import TraceWriter, TraceError
 import logging
-import random
+import multiprocessing
+import os
+import re
 import sys
-
-
-window = tk.Tk()
-window.title("MLFQ Round Robin Scheduler")
-window.geometry("1080x720")
-window.wm_resizable(False, False)
+import threading
 
 
 # Global Variables
@@ -24,23 +23,41 @@ processes:list[Process] = [
     Process("P6", 15, 8, 2), 
     Process("P7", 20, 4, 1)
 ]
-scheduling_algorithms:list[ScedulingAlgorithm] = [FirstComeFirstServe(), ShortestJobFirst(), RoundRobin(), ShortestRemainingTimeFirst(), PriorityScheduling()]
+scheduling_algorithms:list[ScedulingAlgorithm] = default_algorithms()
 current_card:GanttCard = None
 current_process:Process = None
 start_processing = None
 sim_time = 0
 sim_running = False
+step_job = None
+checkpoint_path = "checkpoint.sim"
+checkpoint_interval = 50
+trace_dir = "traces"
 
 
 # Randomizer
 def randomize_processes(n=10):
     global processes
-    processes = []
-    for i in range(1, n+1):
-        processes.append(Process(f'P{str(i)}', random.randint(0, 10), random.randint(1, 10), random.randint(1, 4)))
+    processes = random_processes(n)
     update_process_table()
 
 
+# Replay traces, one file per algorithm
+def open_traces(resume_time:int|None=None):
+    close_traces()
+    os.makedirs(trace_dir, exist_ok=True)
+    for algorithm in scheduling_algorithms:
+        path = os.path.join(trace_dir, re.sub(r"[^A-Za-z0-9]+", "_", algorithm.name).strip("_") + ".trace")
+        algorithm.trace = TraceWriter(path, algorithm.processes, resume_time)
+
+
+def close_traces():
+    for algorithm in scheduling_algorithms:
+        if algorithm.trace:
+            algorithm.trace.close()
+            algorithm.trace = None
+
+
 # Update Process Table
 def update_process_table():
     for row in process_table.get_children():
@@ -62,42 +79,47 @@ def update_queue_display():
                 ProcessCard(algorithm.queue_frame, process)
 
 
+# Pending automatic step; cancelled whenever a run stops or (re)starts so only one loop ticks
+def cancel_step():
+    global step_job
+    if step_job is not None:
+        window.after_cancel(step_job)
+        step_job = None
+
+
 def step():
-    global sim_time, sim_running, current_process, start_processing
+    global sim_time, sim_running, current_process, start_processing, step_job
+    step_job = None
     if not sim_running:
         return
 
-    # Checking arrival time to add to queue
-    for algorithm in scheduling_algorithms:
-        for process in algorithm.processes:
-            if process.arrival_time == sim_time:
-                algorithm.queue.append(process)
-        
-    
-    #Processing the current process
-    for algorithm in scheduling_algorithms:
-        algorithm.process(sim_time)
+    tick(scheduling_algorithms, sim_time)
     
     update_queue_display()
     time_var.set(f"Time: {sim_time}")
     update_stats()
 
     
-    if (all(algorithm.finished() for algorithm in scheduling_algorithms)):
+    if (finished(scheduling_algorithms)):
         sim_running = False
         toggle.configure(state="normal")
         run_button.configure(text="Run MLFQ")
         time_var.set(f"Simulation finished at Time: {sim_time}")
+        close_traces()
+        remove_checkpoint(checkpoint_path)
     else:
         if (sim_automatic.get()):
-            window.after(750, step)
+            step_job = window.after(750, step)
 
     sim_time += 1
+    if (sim_running and sim_time % checkpoint_interval == 0):
+        checkpoint(scheduling_algorithms, sim_time, checkpoint_path)
 
 
 # Simulation (Round Robin with animated cards & time counter)
 def simulate_mlfq_step():
     global sim_time, sim_running
+    cancel_step()
     if sim_running:
         sim_running = False
         toggle.configure(state="normal")
@@ -108,14 +130,12 @@ def simulate_mlfq_step():
         run_button.configure(text="Stop MLFQ")
 
     sim_time = 0
-    for algorithm in scheduling_algorithms:
-        algorithm.current_card = None
-        algorithm.current_process = None
-
-    for algorithm in scheduling_algorithms:
-        algorithm.queue.clear()
-        algorithm.processes = copy.deepcopy(processes)
-        algorithm.processes.sort(key=lambda x: (x.arrival_time, int(x.name[1:])))
+    reset(scheduling_algorithms, processes)
+    if sim_running:
+        remove_checkpoint(checkpoint_path)
+        open_traces()
+    else:
+        close_traces()
 
     # Clear previous Gantt
     for algorithm in scheduling_algorithms:
@@ -127,23 +147,85 @@ def simulate_mlfq_step():
     step()
 
 
+# Resume from the last checkpoint
+def resume_simulation():
+    global sim_time, sim_running, processes
+    if sim_running:
+        return
+    cancel_step()
+    if not os.path.exists(checkpoint_path):
+        messagebox.showwarning("Resume", "No checkpoint to resume from.")
+        return
+    try:
+        sim_time = load_snapshot(checkpoint_path, scheduling_algorithms)
+        open_traces(sim_time)
+    except (SnapshotError, TraceError, ValueError) as e:
+        close_traces()
+        messagebox.showerror("Resume", f"Could not resume from checkpoint: {e}")
+        return
+
+    # The checkpoint may come from an earlier session, so the workload on screen follows it
+    processes = [Process(p.name, p.arrival_time, p.original_burst_time, p.original_priority) for p in scheduling_algorithms[0].processes]
+    update_process_table()
+
+    # Gantt history before the checkpoint is not stored, only the running process is redrawn
+    for algorithm in scheduling_algorithms:
+        for widget in algorithm.chart.gantt_inner.winfo_children():
+            widget.destroy()
+        for widget in algorithm.queue_frame.winfo_children():
+            widget.destroy()
+        if algorithm.current_process:
+            algorithm.current_card = GanttCard(algorithm.chart.gantt_inner, algorithm.current_process)
+
+    sim_running = True
+    toggle.configure(state="disabled")
+    run_button.configure(text="Stop MLFQ")
+    update_queue_display()
+    step()
+
+
 # Stats
 def update_stats():
     for algorithm in scheduling_algorithms:
-        total_wait = 0
-        total_turnaround = 0
-        total_response = 0
-        for p in algorithm.processes:
-            total_wait += p.turnaround_time - p.original_burst_time
-            total_turnaround += p.turnaround_time
-            total_response += p.first_response - p.arrival_time
-        n = len(processes)
-        avg_wait = total_wait / n if n else 0
-        avg_turnaround = total_turnaround / n if n else 0
-        avg_response = total_response / n if n else 0
+        avg_wait, avg_turnaround, avg_response = average_metrics(algorithm.processes)
         algorithm.stats.set(f"Avg Waiting Time: {avg_wait:.2f} | Avg Turnaround Time: {avg_turnaround:.2f} | Avg Response Time: {avg_response:.2f}")
 
 
+# Statistical comparison over seeded replications
+def compare_algorithms(n=10):
+    from replication import compare
+    # Replications run in a worker thread so the window stays responsive; results are polled
+    compare_button.configure(state="disabled")
+    for algorithm in scheduling_algorithms:
+        algorithm.comparison.set("Running replications...")
+    result = {}
+
+    def work():
+        try:
+            result["comparison"] = compare(target_width=1.0, n_processes=n)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=work, daemon=True)
+    thread.start()
+    window.after(100, lambda: poll_comparison(thread, result))
+
+
+def poll_comparison(thread:threading.Thread, result:dict):
+    if thread.is_alive():
+        window.after(100, lambda: poll_comparison(thread, result))
+        return
+    compare_button.configure(state="normal")
+    if "error" in result:
+        for algorithm in scheduling_algorithms:
+            algorithm.comparison.set("")
+        messagebox.showerror("Compare", f"Comparison failed: {result['error']}")
+        return
+    comparison = result["comparison"]
+    for algorithm in scheduling_algorithms:
+        algorithm.comparison.set(f"{comparison.status()}\n{comparison.format(algorithm.name)}")
+
+
 def toggle_action():
     if sim_automatic.get():
         toggle.configure(text="Automatic", relief=tk.SUNKEN)
@@ -159,72 +241,94 @@ def scroll_canvas(event):
 
 
 # GUI
-canvas = tk.Canvas(window)
-scrollbar = ttk.Scrollbar(window, orient="vertical", command=canvas.yview) 
-canvas.configure(yscrollcommand=scrollbar.set)
-canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-
-canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-canvas.bind_all("<MouseWheel>", scroll_canvas)
-
-root = tk.Frame(canvas)
-canvas.create_window((0,0), window=root, anchor="nw", width=1060)
-
-sim_automatic = tk.BooleanVar(value=True)
-
-top_frame = tk.Frame(root)
-top_frame.pack(side=tk.TOP, fill=tk.X)
-tk.Button(top_frame, text="Modify", command=lambda: ModifyWindow(processes, process_table)).pack(side=tk.LEFT, padx=5, pady=5)
-tk.Button(top_frame, text="Randomize (10)", command=lambda: randomize_processes(10)).pack(side=tk.LEFT, padx=5, pady=5)
-
-process_frame = tk.Frame(root)
-process_frame.pack(side=tk.TOP, fill=tk.BOTH)
-columns = ("PID", "Arrival", "Burst", "Priority")
-process_table = ttk.Treeview(process_frame, columns=columns, show="headings", height=6)
-for col in columns:
-    process_table.heading(col, text=col)
-    process_table.column(col, width=10)
-scrollbar = ttk.Scrollbar(process_frame, orient="vertical", command=process_table.yview)
-process_table.configure(yscroll=scrollbar.set)
-process_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-main_frame = tk.Frame(root)
-main_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-gantt_top_frame = tk.Frame(main_frame)
-gantt_top_frame.pack(anchor='center')
-time_var = tk.StringVar(value="Time:")
-run_button = tk.Button(gantt_top_frame, text="Run MLFQ", command=simulate_mlfq_step)
-run_button.pack(side=tk.LEFT, padx=5, pady=5)
-toggle = tk.Checkbutton(gantt_top_frame, text="Automatic", variable=sim_automatic, command=toggle_action, indicatoron=0, relief=tk.SUNKEN, width=10)
-toggle.pack(side=tk.LEFT, padx=5, pady=5)
-step_button = tk.Button(gantt_top_frame, text="Step", command=step, state="disabled")
-step_button.pack(side=tk.LEFT, padx=5, pady=5)
-tk.Label(gantt_top_frame, textvariable=time_var, font=("Arial", 12)).pack(side=tk.LEFT)
-
-
-for algorithm in scheduling_algorithms:
-    algo_frame = tk.Frame(main_frame, bd=2, relief="groove")
-    algo_frame.pack(side=tk.TOP, fill=tk.BOTH, padx=10, pady=10)
-
-    tk.Label(algo_frame, text=algorithm.name, font=("Arial", 12, "bold")).pack(side=tk.TOP)
-    tk.Label(algo_frame, textvariable=algorithm.stats, font=("Arial", 12)).pack(pady=(10, 20), side=tk.TOP)
-
-    queue_frame = tk.Frame(algo_frame, width=500)
-    queue_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=10, pady=10)
-    queue_frame.pack_propagate(False)
-
-    algorithm.queue_frame = tk.Frame(queue_frame)
-    algorithm.queue_frame.pack(pady=5, fill=tk.X)
-
-    gantt_frame = tk.Frame(algo_frame)
-    gantt_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    algorithm.chart = GanttChart(gantt_frame, algorithm.name)
-    algorithm.chart.all_pack()
-
-update_process_table()
-update_stats()
-window.mainloop()
+def build_gui():
+    global window, canvas, scrollbar, process_table, sim_automatic, time_var, run_button, toggle, step_button, compare_button
+    window = tk.Tk()
+    window.title("MLFQ Round Robin Scheduler")
+    window.geometry("1080x720")
+    window.wm_resizable(False, False)
+
+    canvas = tk.Canvas(window)
+    scrollbar = ttk.Scrollbar(window, orient="vertical", command=canvas.yview) 
+    canvas.configure(yscrollcommand=scrollbar.set)
+    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+
+    canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+
+    canvas.bind_all("<MouseWheel>", scroll_canvas)
+
+    root = tk.Frame(canvas)
+    canvas.create_window((0,0), window=root, anchor="nw", width=1060)
+
+    sim_automatic = tk.BooleanVar(value=True)
+
+    top_frame = tk.Frame(root)
+    top_frame.pack(side=tk.TOP, fill=tk.X)
+    tk.Button(top_frame, text="Modify", command=lambda: ModifyWindow(processes, process_table)).pack(side=tk.LEFT, padx=5, pady=5)
+    tk.Button(top_frame, text="Randomize (10)", command=lambda: randomize_processes(10)).pack(side=tk.LEFT, padx=5, pady=5)
+    compare_button = tk.Button(top_frame, text="Compare (CI)", command=lambda: compare_algorithms(10))
+    compare_button.pack(side=tk.LEFT, padx=5, pady=5)
+
+    process_frame = tk.Frame(root)
+    process_frame.pack(side=tk.TOP, fill=tk.BOTH)
+    columns = ("PID", "Arrival", "Burst", "Priority")
+    process_table = ttk.Treeview(process_frame, columns=columns, show="headings", height=6)
+    for col in columns:
+        process_table.heading(col, text=col)
+        process_table.column(col, width=10)
+    scrollbar = ttk.Scrollbar(process_frame, orient="vertical", command=process_table.yview)
+    process_table.configure(yscroll=scrollbar.set)
+    process_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    main_frame = tk.Frame(root)
+    main_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+    gantt_top_frame = tk.Frame(main_frame)
+    gantt_top_frame.pack(anchor='center')
+    time_var = tk.StringVar(value="Time:")
+    run_button = tk.Button(gantt_top_frame, text="Run MLFQ", command=simulate_mlfq_step)
+    run_button.pack(side=tk.LEFT, padx=5, pady=5)
+    toggle = tk.Checkbutton(gantt_top_frame, text="Automatic", variable=sim_automatic, command=toggle_action, indicatoron=0, relief=tk.SUNKEN, width=10)
+    toggle.pack(side=tk.LEFT, padx=5, pady=5)
+    step_button = tk.Button(gantt_top_frame, text="Step", command=step, state="disabled")
+    step_button.pack(side=tk.LEFT, padx=5, pady=5)
+    tk.Button(gantt_top_frame, text="Resume", command=resume_simulation).pack(side=tk.LEFT, padx=5, pady=5)
+    tk.Label(gantt_top_frame, textvariable=time_var, font=("Arial", 12)).pack(side=tk.LEFT)
+
+
+    for algorithm in scheduling_algorithms:
+        algo_frame = tk.Frame(main_frame, bd=2, relief="groove")
+        algo_frame.pack(side=tk.TOP, fill=tk.BOTH, padx=10, pady=10)
+
+        algorithm.stats = tk.StringVar()
+        algorithm.comparison = tk.StringVar()
+        tk.Label(algo_frame, text=algorithm.name, font=("Arial", 12, "bold")).pack(side=tk.TOP)
+        tk.Label(algo_frame, textvariable=algorithm.stats, font=("Arial", 12)).pack(pady=(10, 0), side=tk.TOP)
+        tk.Label(algo_frame, textvariable=algorithm.comparison, font=("Arial", 10)).pack(pady=(0, 20), side=tk.TOP)
+
+        queue_frame = tk.Frame(algo_frame, width=500)
+        queue_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=10, pady=10)
+        queue_frame.pack_propagate(False)
+
+        algorithm.queue_frame = tk.Frame(queue_frame)
+        algorithm.queue_frame.pack(pady=5, fill=tk.X)
+
+        gantt_frame = tk.Frame(algo_frame)
+        gantt_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        algorithm.chart = GanttChart(gantt_frame, algorithm.name)
+        algorithm.chart.all_pack()
+
+
+def main():
+    build_gui()
+    update_process_table()
+    update_stats()
+    window.mainloop()
+
+
+if __name__ == "__main__":
+    # Needed by the replication worker processes in the frozen executable
+    multiprocessing.freeze_support()
+    main()
@@ -5,8 +5,8 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('./objects.py', '.'), ('./algorithms.py', '.')],
-    hiddenimports=['pandas'],
+    datas=[('./objects.py', '.'), ('./algorithms.py', '.'), ('./process.py', '.'), ('./engine.py', '.'), ('./snapshot.py', '.'), ('./timeline.py', '.'), ('./replication.py', '.')],
+    hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,40 @@
+class Process:
+    def __init__(self, name:str, arrival_time:int, burst_time:int, priority:int=3):
+        self.name = name
+        self.arrival_time = arrival_time
+        self.original_burst_time = burst_time
+        self.burst_time = burst_time
+        self.original_priority = priority
+        self.priority = priority
+        self.first_response = -1  # not dispatched yet; 0 is a valid response time
+        self.sub_wait_time = 0
+        self.processed_time = 0
+        self.processing_time = 0
+        self.completion_time = 0
+        self.waiting_time = 0
+        self.turnaround_time = 0
+
+    def complete(self, time):
+        self.completion_time = time
+        self.turnaround_time = self.completion_time - self.arrival_time
+    
+    def is_completed(self):
+        return self.burst_time == 0
+
+    def increase_priority(self):
+        self.priority -= 1
+        self.sub_wait_time = 0
+    
+    def decrease_priority(self):
+        self.priority += 1
+        self.processed_time = 0
+    
+    def wait(self):
+        self.sub_wait_time += 1
+    
+    def process(self):
+        self.processed_time += 1
+        self.burst_time -= 1
+    
+    def __str__(self):
+        return f"{self.name} (burst_time: {str(self.burst_time)}, processed_time: {str(self.processed_time)}, sub_wait_time: {str(self.sub_wait_time)}, arrival_time: {str(self.arrival_time)})"
@@ -0,0 +1,121 @@
+import os
+import struct
+from process import Process
+
+
+# Binary layout (little endian):
+#   header    : magic, version, sim_time, algorithm count
+#   algorithm : name, current index, time in quantum, queue indices, process table
+#   process   : name, then the integer fields listed in PROCESS_FIELDS (first_response is -1 until dispatched)
+MAGIC = b"SCHS"
+VERSION = 2
+HEADER = struct.Struct("<4sHqH")
+ALGORITHM = struct.Struct("<iqII")
+INDEX = struct.Struct("<I")
+NAME = struct.Struct("<H")
+PROCESS_FIELDS = (
+    "arrival_time", "original_burst_time", "burst_time", "original_priority", "priority",
+    "first_response", "sub_wait_time", "processed_time", "processing_time",
+    "completion_time", "waiting_time", "turnaround_time",
+)
+PROCESS = struct.Struct(f"<{len(PROCESS_FIELDS)}q")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _pack_name(name:str) -> bytes:
+    encoded = name.encode("utf-8")
+    return NAME.pack(len(encoded)) + encoded
+
+
+def _unpack_name(buffer, offset:int) -> tuple[str, int]:
+    (length,) = NAME.unpack_from(buffer, offset)
+    offset += NAME.size
+    return bytes(buffer[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def pack_snapshot(sim_time:int, algorithms:list) -> bytes:
+    """Serialize the clock and every algorithm's queue, running process and process table."""
+    chunks = [HEADER.pack(MAGIC, VERSION, sim_time, len(algorithms))]
+    for algorithm in algorithms:
+        index = {id(process): i for i, process in enumerate(algorithm.processes)}
+        current = index[id(algorithm.current_process)] if algorithm.current_process else -1
+        chunks.append(_pack_name(algorithm.name))
+        chunks.append(ALGORITHM.pack(current, getattr(algorithm, "time_in_quantum", 0), len(algorithm.queue), len(algorithm.processes)))
+        chunks.extend(INDEX.pack(index[id(process)]) for process in algorithm.queue)
+        for process in algorithm.processes:
+            chunks.append(_pack_name(process.name))
+            chunks.append(PROCESS.pack(*(getattr(process, field) for field in PROCESS_FIELDS)))
+    return b"".join(chunks)
+
+
+def unpack_snapshot(buffer, algorithms:list) -> int:
+    """Restore a snapshot into the given algorithms (matched by name) and return its sim_time.
+
+    The whole snapshot is parsed and checked first, so on SnapshotError no algorithm is modified.
+    """
+    try:
+        sim_time, states = _parse_snapshot(buffer)
+    except struct.error as e:
+        raise SnapshotError(f"Truncated snapshot: {e}")
+    except UnicodeDecodeError as e:
+        raise SnapshotError(f"Corrupt name in snapshot: {e}")
+
+    by_name = {algorithm.name: algorithm for algorithm in algorithms}
+    names = [name for name, *_ in states]
+    if len(names) != len(set(names)) or set(names) != set(by_name):
+        raise SnapshotError(f"Snapshot algorithms {names} do not match {list(by_name)}.")
+    for name, current, time_in_quantum, queue, processes in states:
+        if not -1 <= current < len(processes) or any(i >= len(processes) for i in queue):
+            raise SnapshotError(f"Snapshot has an out of range process index for '{name}'.")
+
+    for name, current, time_in_quantum, queue, processes in states:
+        algorithm = by_name[name]
+        algorithm.processes = processes
+        algorithm.queue = [processes[i] for i in queue]
+        algorithm.current_process = processes[current] if current >= 0 else None
+        algorithm.current_card = None
+        if hasattr(algorithm, "time_in_quantum"):
+            algorithm.time_in_quantum = time_in_quantum
+    return sim_time
+
+
+def _parse_snapshot(buffer) -> tuple[int, list[tuple[str, int, int, list[int], list[Process]]]]:
+    magic, version, sim_time, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError("Not a scheduler snapshot or unsupported version.")
+    states = []
+    offset = HEADER.size
+    for _ in range(count):
+        name, offset = _unpack_name(buffer, offset)
+        current, time_in_quantum, queue_len, process_count = ALGORITHM.unpack_from(buffer, offset)
+        offset += ALGORITHM.size
+        queue = [INDEX.unpack_from(buffer, offset + i * INDEX.size)[0] for i in range(queue_len)]
+        offset += queue_len * INDEX.size
+        processes:list[Process] = []
+        for _ in range(process_count):
+            process_name, offset = _unpack_name(buffer, offset)
+            values = PROCESS.unpack_from(buffer, offset)
+            offset += PROCESS.size
+            process = Process(process_name, 0, 0)
+            for field, value in zip(PROCESS_FIELDS, values):
+                setattr(process, field, value)
+            processes.append(process)
+        states.append((name, current, time_in_quantum, queue, processes))
+    return sim_time, states
+
+
+def save_snapshot(path:str, sim_time:int, algorithms:list):
+    # Write to a temporary file first so an interrupted checkpoint never clobbers the last good one
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(pack_snapshot(sim_time, algorithms))
+    os.replace(temp_path, path)
+
+
+def load_snapshot(path:str, algorithms:list) -> int:
+    # Every record becomes a Process object straight away, so a plain read is as fast as mapping the file
+    with open(path, "rb") as file:
+        return unpack_snapshot(file.read(), algorithms)
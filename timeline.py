@@ -0,0 +1,226 @@
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+
+
+# Trace layout (little endian):
+#   header  : magic, version, process count
+#   process : arrival time, burst time, name  (one entry per pid, pid = position)
+#   records : fixed size (time, pid, event), appended in non-decreasing time order
+DISPATCH = 1
+PREEMPT = 2
+COMPLETE = 3
+EVENT_NAMES = {DISPATCH: "dispatch", PREEMPT: "preempt", COMPLETE: "complete"}
+
+MAGIC = b"SCHT"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+PROCESS = struct.Struct("<qqH")
+RECORD = struct.Struct("<qIB3x")
+DIFF_CHUNK = 4096 * RECORD.size
+
+
+class TraceError(Exception):
+    pass
+
+
+class TraceWriter:
+    """Appends dispatch, preempt and complete events of one algorithm run to a trace file."""
+
+    def __init__(self, path:str, processes:list, resume_time:int|None=None):
+        self.path = path
+        # Keyed by identity, not name: ModifyWindow does not stop two processes sharing a name
+        self.pids = {id(process): pid for pid, process in enumerate(processes)}
+        if resume_time is not None and os.path.exists(path) and os.path.getsize(path) > 0:
+            # Drop everything recorded at or after the resume point, it is about to be replayed
+            with TraceReader(path) as reader:
+                if (reader.names != [process.name for process in processes]
+                        or reader.arrivals != [process.arrival_time for process in processes]
+                        or reader.bursts != [process.original_burst_time for process in processes]):
+                    raise TraceError(f"{path} was recorded for a different workload and cannot be resumed.")
+                end = reader.data_offset + reader.seek(resume_time) * RECORD.size
+            self.file = open(path, "r+b")
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            self.file = open(path, "wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION, len(processes)))
+            for process in processes:
+                encoded = process.name.encode("utf-8")
+                self.file.write(PROCESS.pack(process.arrival_time, process.original_burst_time, len(encoded)) + encoded)
+
+    def write(self, event:int, time:int, process):
+        self.file.write(RECORD.pack(time, self.pids[id(process)], event))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class _Times:
+    # Sequence view over the record times so bisect can search the mapped file directly
+    def __init__(self, reader:"TraceReader"):
+        self.reader = reader
+
+    def __len__(self):
+        return len(self.reader)
+
+    def __getitem__(self, i:int) -> int:
+        return struct.unpack_from("<q", self.reader.buffer, self.reader.data_offset + i * RECORD.size)[0]
+
+
+class TraceReader:
+    """Memory mapped, read-only view of a trace with seek by time and lookup by pid."""
+
+    def __init__(self, path:str):
+        self.file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count = HEADER.unpack_from(self.buffer, 0)
+            if magic != MAGIC or version != VERSION:
+                raise TraceError(f"{path} is not a scheduler trace or has an unsupported version.")
+            self.names:list[str] = []
+            self.arrivals:list[int] = []
+            self.bursts:list[int] = []
+            offset = HEADER.size
+            for _ in range(count):
+                arrival, burst, length = PROCESS.unpack_from(self.buffer, offset)
+                offset += PROCESS.size
+                self.names.append(bytes(self.buffer[offset:offset + length]).decode("utf-8"))
+                self.arrivals.append(arrival)
+                self.bursts.append(burst)
+                offset += length
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise TraceError(f"Could not read trace {path}: {e}")
+        self.data_offset = offset
+        # Unique label per pid; duplicated names get their pid appended, e.g. "P3#4"
+        counts = Counter(self.names)
+        self.labels = [name if counts[name] == 1 else f"{name}#{pid}" for pid, name in enumerate(self.names)]
+        # A partially written last record (interrupted run) is ignored
+        self.count = (len(self.buffer) - offset) // RECORD.size
+        self._pid_index:dict[int, array] | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if getattr(self, "buffer", None) is not None:
+            self.buffer.close()
+            self.buffer = None
+        self.file.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i:int) -> tuple[int, str, int]:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        time, pid, event = RECORD.unpack_from(self.buffer, self.data_offset + i * RECORD.size)
+        return time, self.labels[pid], event
+
+    def records(self, start:int=0, end:int|None=None):
+        end = self.count if end is None else min(end, self.count)
+        for time, pid, event in RECORD.iter_unpack(self.buffer[self.data_offset + start * RECORD.size:self.data_offset + end * RECORD.size]):
+            yield time, self.labels[pid], event
+
+    def seek(self, time:int) -> int:
+        """Index of the first record at or after the given time."""
+        return bisect.bisect_left(_Times(self), time)
+
+    def between(self, start:int, end:int):
+        return self.records(self.seek(start), self.seek(end))
+
+    def for_process(self, label:str) -> list[tuple[int, str, int]]:
+        if self._pid_index is None:
+            self._pid_index = {pid: array("I") for pid in range(len(self.names))}
+            for i, (_, pid, _) in enumerate(RECORD.iter_unpack(self.buffer[self.data_offset:self.data_offset + self.count * RECORD.size])):
+                self._pid_index[pid].append(i)
+        return [self[i] for i in self._pid_index[self.labels.index(label)]]
+
+    def costs(self) -> dict[str, tuple[int, int, int]]:
+        """Waiting, turnaround and response time of every completed process."""
+        first_dispatch:dict[int, int] = {}
+        completion:dict[int, int] = {}
+        for time, pid, event in RECORD.iter_unpack(self.buffer[self.data_offset:self.data_offset + self.count * RECORD.size]):
+            if event == DISPATCH and pid not in first_dispatch:
+                first_dispatch[pid] = time
+            elif event == COMPLETE:
+                completion[pid] = time
+        costs = {}
+        for pid, name in enumerate(self.labels):
+            if pid in completion:
+                turnaround = completion[pid] - self.arrivals[pid]
+                costs[name] = (turnaround - self.bursts[pid], turnaround, first_dispatch.get(pid, self.arrivals[pid]) - self.arrivals[pid])
+        return costs
+
+
+def _first_difference(a:TraceReader, b:TraceReader) -> int | None:
+    count = min(len(a), len(b))
+    if a.names == b.names:
+        # Same process table, so identical records are identical bytes: compare in large chunks
+        for start in range(0, count * RECORD.size, DIFF_CHUNK):
+            end = min(start + DIFF_CHUNK, count * RECORD.size)
+            if a.buffer[a.data_offset + start:a.data_offset + end] != b.buffer[b.data_offset + start:b.data_offset + end]:
+                first = start // RECORD.size
+                for i, (left, right) in enumerate(zip(a.records(first, end // RECORD.size), b.records(first, end // RECORD.size))):
+                    if left != right:
+                        return first + i
+    else:
+        for i, (left, right) in enumerate(zip(a.records(), b.records())):
+            if left != right:
+                return i
+    return None if len(a) == len(b) else count
+
+
+def diff_traces(a:TraceReader, b:TraceReader) -> tuple[int | None, dict[str, tuple]]:
+    """Return the time both timelines diverge (None if identical) and per-process costs of each."""
+    index = _first_difference(a, b)
+    divergence = None
+    if index is not None:
+        times = [reader[index][0] for reader in (a, b) if index < len(reader)]
+        divergence = min(times)
+    costs_a = a.costs()
+    costs_b = b.costs()
+    per_process = {label: (costs_a.get(label), costs_b.get(label)) for label in dict.fromkeys(a.labels + b.labels)}
+    return divergence, per_process
+
+
+def _format_costs(costs) -> str:
+    return "-" if costs is None else "W:{} T:{} R:{}".format(*costs)
+
+
+def main(argv:list[str]):
+    if len(argv) != 2:
+        print("Usage: python timeline.py <first.trace> <second.trace>")
+        return 2
+    with TraceReader(argv[0]) as a, TraceReader(argv[1]) as b:
+        divergence, per_process = diff_traces(a, b)
+        if divergence is None:
+            print("Timelines are identical.")
+        else:
+            print(f"Timelines diverge at time {divergence}:")
+            for label, reader in (("A", a), ("B", b)):
+                start = reader.seek(divergence)
+                for time, name, event in reader.records(start, start + 3):
+                    print(f"  {label} t={time} {EVENT_NAMES[event]} {name}")
+        print(f"{'Process':<10}{'A':<24}{'B':<24}dWait")
+        for name, (left, right) in per_process.items():
+            delta = right[0] - left[0] if left and right else "-"
+            print(f"{name:<10}{_format_costs(left):<24}{_format_costs(right):<24}{delta}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,146 @@
+import bisect
+import copy
+import os
+from process import Process
+from engine import default_algorithms, reset, tick, finished, run, validate, validate_process, time_limit, arrival_order, average_metrics
+from snapshot import pack_snapshot, unpack_snapshot
+
+
+class Perturbation:
+    """Edits to the baseline workload: new burst times, added processes and deleted process names."""
+
+    def __init__(self, bursts:dict[str, int]|None=None, added:list[Process]|None=None, deleted:list[str]|None=None, label:str=""):
+        self.bursts = bursts or {}
+        self.added = added or []
+        self.deleted = deleted or []
+        self.label = label
+        for name, burst in self.bursts.items():
+            if not isinstance(burst, int) or burst <= 0:
+                raise ValueError(f"Invalid burst time {burst!r} for {name}.")
+        for process in self.added:
+            validate_process(process)
+        added_names = [process.name for process in self.added]
+        if len(set(added_names)) != len(added_names):
+            raise ValueError("Added processes must have unique names.")
+
+    def earliest_time(self, processes:list[Process]) -> int|None:
+        """First time unit the edits can influence, or None if nothing is edited."""
+        arrivals = {process.name: process.arrival_time for process in processes}
+        unknown = [name for name in list(self.bursts) + self.deleted if name not in arrivals]
+        if unknown:
+            raise ValueError(f"Unknown process(es) in perturbation: {', '.join(unknown)}")
+        clashing = [process.name for process in self.added if process.name in arrivals and process.name not in self.deleted]
+        if clashing:
+            raise ValueError(f"Added process(es) clash with existing names: {', '.join(clashing)}")
+        # A process has no effect on any algorithm before it arrives
+        times = [arrivals[name] for name in list(self.bursts) + self.deleted]
+        times += [process.arrival_time for process in self.added]
+        return min(times) if times else None
+
+    def apply(self, processes:list[Process]):
+        """Edit a process table in place; only valid for processes that have not arrived yet."""
+        for process in processes:
+            if process.name in self.bursts:
+                process.original_burst_time = process.burst_time = self.bursts[process.name]
+        processes[:] = [process for process in processes if process.name not in self.deleted]
+        processes.extend(copy.deepcopy(self.added))
+        processes.sort(key=arrival_order)
+
+
+def burst_sensitivity(processes:list[Process], factors:tuple[float, ...]=(0.8, 1.2)) -> list[Perturbation]:
+    """One perturbation per process and factor, e.g. every burst -20% and +20%."""
+    return [
+        Perturbation(bursts={p.name: max(1, round(p.original_burst_time * factor))}, label=f"{p.name} x{factor}")
+        for p in processes for factor in factors
+    ]
+
+
+def _metrics(algorithms) -> dict[str, tuple[float, float, float]]:
+    return {algorithm.name: average_metrics(algorithm.processes) for algorithm in algorithms}
+
+
+def checkpoint_times(processes:list[Process], max_checkpoints:int) -> list[int]:
+    """Distinct arrival times (plus 0) to snapshot at, thinned evenly to at most max_checkpoints."""
+    # Edits only take effect from an arrival, so snapshots elsewhere are never the best restart point
+    arrivals = sorted({0} | {process.arrival_time for process in processes})
+    if len(arrivals) <= max_checkpoints:
+        return arrivals
+    step = (len(arrivals) - 1) / (max_checkpoints - 1)
+    return sorted({arrivals[round(i * step)] for i in range(max_checkpoints)})
+
+
+class Baseline:
+    """A complete run of a workload with a bounded number of in-memory snapshots to resimulate edits from."""
+
+    def __init__(self, processes:list[Process], max_checkpoints:int=32, algorithms_factory=default_algorithms):
+        if max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1.")
+        self.processes = copy.deepcopy(processes)
+        self.algorithms_factory = algorithms_factory
+        self.checkpoint_times = checkpoint_times(self.processes, max_checkpoints)
+        self.checkpoints:list[bytes] = []
+
+        algorithms = algorithms_factory()
+        reset(algorithms, self.processes)
+        validate(algorithms)
+        limit = time_limit(algorithms)
+        pending = iter(self.checkpoint_times)
+        next_checkpoint = next(pending)
+        sim_time = 0
+        while True:
+            if sim_time == next_checkpoint:
+                self.checkpoints.append(pack_snapshot(sim_time, algorithms))
+                next_checkpoint = next(pending, None)
+            tick(algorithms, sim_time)
+            if finished(algorithms):
+                break
+            if sim_time >= limit:
+                raise RuntimeError(f"Baseline did not finish by time {limit}.")
+            sim_time += 1
+        self.end_time = sim_time
+        self.results = _metrics(algorithms)
+
+    def _checkpoint_for(self, perturbation:Perturbation) -> bytes | None:
+        """Latest snapshot taken before anything edited could have been admitted, None if nothing is edited."""
+        earliest = perturbation.earliest_time(self.processes)
+        if earliest is None:
+            return None
+        return self.checkpoints[bisect.bisect_right(self.checkpoint_times, earliest) - 1]
+
+    def evaluate(self, perturbation:Perturbation) -> dict[str, tuple[float, float, float]]:
+        """Average waiting, turnaround and response time per algorithm with the edits applied."""
+        snapshot = self._checkpoint_for(perturbation)
+        if snapshot is None:
+            return self.results
+        return _evaluate_from(snapshot, perturbation, self.algorithms_factory)
+
+    def evaluate_many(self, perturbations:list[Perturbation], workers:int|None=None) -> list[dict[str, tuple[float, float, float]]]:
+        """Evaluate a batch of perturbations, in parallel worker processes unless workers is 1."""
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(perturbations) < 2:
+            return [self.evaluate(perturbation) for perturbation in perturbations]
+        # Each task carries only the one snapshot it restarts from, not the whole baseline
+        snapshots = [self._checkpoint_for(perturbation) for perturbation in perturbations]
+        tasks = [i for i, snapshot in enumerate(snapshots) if snapshot is not None]
+        results = [self.results] * len(perturbations)
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(
+                _evaluate_from,
+                [snapshots[i] for i in tasks],
+                [perturbations[i] for i in tasks],
+                [self.algorithms_factory] * len(tasks),
+                chunksize=max(1, len(tasks) // (workers * 4)),
+            )
+            for i, outcome in zip(tasks, outcomes):
+                results[i] = outcome
+        return results
+
+
+def _evaluate_from(snapshot:bytes, perturbation:Perturbation, algorithms_factory) -> dict[str, tuple[float, float, float]]:
+    algorithms = algorithms_factory()
+    sim_time = unpack_snapshot(snapshot, algorithms)
+    for algorithm in algorithms:
+        perturbation.apply(algorithm.processes)
+    run(algorithms, sim_time)
+    return _metrics(algorithms)